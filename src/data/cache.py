@@ -1,15 +1,118 @@
-from cachebox import Cache
-import pickle
+import atexit
+import os
+import threading
 
-# Global cache instance
-#with open('cache.pkl', 'rb') as f:
-#    _cache = pickle.load(f)
-_cache = Cache(maxsize=0)
+import orjson
+from cachebox import LFUCache
+from pydantic import BaseModel, TypeAdapter
 
-def get_cache() -> Cache:
+from src.data.models import (
+    CompanyNews,
+    FinancialMetrics,
+    InsiderTrade,
+    LineItems,
+    Price,
+)
+
+_CACHE_FILE = 'cache.json'
+
+# Flush to disk after this many inserts so a crash loses at most one batch,
+# without re-serializing the whole cache on every API response. The API layer
+# is called from worker threads, so flushes are serialized by a lock.
+_FLUSH_EVERY = 500
+_dirty = 0
+_save_lock = threading.Lock()
+
+# Map the kind segment embedded in each cache key to a bulk validator for its
+# values; TypeAdapter validates a whole list in one pass through the Rust core
+# instead of one validator invocation per item
+_KEY_KIND_ADAPTERS = {
+    "prices": TypeAdapter(list[Price]),
+    "metrics": TypeAdapter(list[FinancialMetrics]),
+    "line-items": TypeAdapter(list[LineItems]),
+    "insider-trades": TypeAdapter(list[InsiderTrade]),
+    "company-news": TypeAdapter(list[CompanyNews]),
+}
+
+# Global cache instance, bounded so long multi-ticker runs don't grow RSS without limit.
+# Size is tunable via HEDGE_CACHE_MAX. Eviction is least-frequently-used rather than
+# LRU so a one-off screening sweep across hundreds of tickers can't flush the hot
+# entries the analyst agents re-read every day of a backtest.
+_cache = LFUCache(maxsize=int(os.environ.get("HEDGE_CACHE_MAX", 100_000)))
+
+def get_cache() -> LFUCache:
     """Get the global cache instance."""
     return _cache
 
+def _adapter_for_key(cache_key: str) -> TypeAdapter | None:
+    for kind, adapter in _KEY_KIND_ADAPTERS.items():
+        if f"_{kind}_" in cache_key:
+            return adapter
+    return None
+
+def _to_jsonable(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError
+
+def _write_cache_file():
+    # Caller must hold _save_lock. Write to a temp file and rename so a crash
+    # mid-write can't corrupt the cache file
+    global _dirty
+    # Worker threads keep inserting while we snapshot, and cachebox raises
+    # RuntimeError if the cache mutates mid-iteration — retry a few times and
+    # skip this flush if the cache won't hold still; the next threshold or
+    # the atexit hook will pick it up
+    for _ in range(5):
+        try:
+            snapshot = {key: value for key, value in _cache.items()}
+            break
+        except RuntimeError:
+            continue
+    else:
+        return
+    tmp_path = _CACHE_FILE + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(snapshot, default=_to_jsonable))
+    os.replace(tmp_path, _CACHE_FILE)
+    _dirty = 0
+
 def save_cache():
-    with open('cache.pkl', 'wb') as f:
-        pickle.dump(_cache, f)
+    with _save_lock:
+        _write_cache_file()
+
+def save_cache_if_dirty():
+    """Flush the cache to disk once enough new entries have accumulated."""
+    global _dirty
+    _dirty += 1
+    # Skip rather than block if another thread is already flushing — that
+    # flush covers these entries too
+    if _dirty >= _FLUSH_EVERY and _save_lock.acquire(blocking=False):
+        try:
+            _write_cache_file()
+        finally:
+            _save_lock.release()
+
+def load_cache():
+    """Warm the cache from disk, hydrating values back into their models."""
+    if not os.path.exists(_CACHE_FILE):
+        return
+    try:
+        with open(_CACHE_FILE, 'rb') as f:
+            raw = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        # An unreadable or corrupt file shouldn't break every run at import;
+        # drop it and start cold — the next flush rewrites it
+        try:
+            os.remove(_CACHE_FILE)
+        except OSError:
+            pass
+        return
+    for cache_key, value in raw.items():
+        adapter = _adapter_for_key(cache_key)
+        if adapter is not None:
+            value = adapter.validate_python(value)
+        _cache.insert(cache_key, value)
+
+load_cache()
+atexit.register(save_cache)
@@ -1,12 +1,17 @@
+import bisect
 import datetime
 import os
 import pandas as pd
 import requests
-from tenacity import retry, wait_random_exponential
+import threading
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from urllib3.util.retry import Retry
 from cachebox import Cache
 import time
 
-from src.data.cache import get_cache
+from src.data.cache import get_cache, save_cache_if_dirty
 from src.data.models import (
     CompanyNews,
     CompanyNewsResponse,
@@ -24,38 +29,158 @@ from src.data.models import (
 # Global cache instance
 _cache = get_cache()
 
+# Pooled session so repeated API calls reuse TCP+TLS connections instead of
+# paying a fresh handshake per request
+_session = requests.Session()
+_session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.5)))
+
+# Full set of line items requested from the search endpoint; hoisted so each
+# call reuses one immutable tuple instead of rebuilding a 30-element list
+_LINE_ITEMS: tuple[str, ...] = (
+    'book_value_per_share',
+    'capital_expenditure',
+    'cash_and_equivalents',
+    'current_assets',
+    'current_liabilities',
+    'debt_to_equity',
+    'depreciation_and_amortization',
+    'dividends_and_other_cash_distributions',
+    'earnings_per_share',
+    'ebit',
+    'ebitda',
+    'free_cash_flow',
+    'goodwill_and_intangible_assets',
+    'gross_margin',
+    'gross_profit',
+    'interest_expense',
+    'issuance_or_purchase_of_equity_shares',
+    'net_income',
+    'operating_expense',
+    'operating_income',
+    'operating_margin',
+    'outstanding_shares',
+    'research_and_development',
+    'return_on_invested_capital',
+    'revenue',
+    'shareholders_equity',
+    'total_assets',
+    'total_debt',
+    'total_liabilities',
+    'working_capital',
+)
+
+# Fetches currently on the wire, keyed by cache key. The analyst agents run in
+# parallel and frequently ask for identical payloads at the same moment; the
+# first caller does the fetch while the rest wait on its Future instead of
+# issuing duplicate requests (the classic cache-stampede fix).
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _fetch_coalesced(cache_key: str, fetch):
+    """Run fetch() for cache_key, sharing the result with concurrent callers."""
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        if future is None:
+            future = Future()
+            _inflight[cache_key] = future
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+# Date ranges already cached per ticker, so a request for a subrange can be
+# served by slicing an existing payload instead of refetching:
+# ticker -> list of (start_date, end_date, cache_key)
+_price_ranges: dict[str, list[tuple[str, str, str]]] = {}
+
+
+def _register_price_range(ticker: str, start_date: str, end_date: str, cache_key: str):
+    _price_ranges.setdefault(ticker, []).append((start_date, end_date, cache_key))
+
+
+def _covering_price_slice(ticker: str, start_date: str, end_date: str) -> list[Price] | None:
+    """Slice a cached price range that fully covers [start_date, end_date], if any."""
+    for range_start, range_end, cache_key in _price_ranges.get(ticker, ()):
+        if range_start <= start_date and end_date <= range_end:
+            prices = _cache.get(cache_key)
+            if prices is None:
+                continue  # evicted since it was registered
+            # Prices are daily-sorted, so the covered window is a contiguous slice
+            dates = [p.time[:10] for p in prices]
+            lo = bisect.bisect_left(dates, start_date)
+            hi = bisect.bisect_right(dates, end_date)
+            return prices[lo:hi]
+    return None
+
+
+# Rebuild the range index from cache keys persisted by a previous run
+for _key in _cache:
+    if isinstance(_key, str) and "_prices_" in _key:
+        _range_ticker, _, _range_dates = _key.partition("_prices_")
+        _range_start, _, _range_end = _range_dates.partition("_")
+        if _range_start and _range_end:
+            _register_price_range(_range_ticker, _range_start, _range_end, _key)
+
+
 @retry(wait=wait_random_exponential(multiplier=1, max=60))
 def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_prices_{start_date}_{end_date}"
 
-    if cache_key in _cache:
-        return _cache[f"{cache_key}"]
+    # Single probe that also updates the entry's eviction standing (vs. separate `in` + `[]` lookups)
+    if (cached := _cache.get(cache_key)) is not None:
+        return cached
 
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    # A wider cached range that contains this window is just as good as an exact hit
+    if (subrange := _covering_price_slice(ticker, start_date, end_date)) is not None:
+        return subrange
 
-    url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        print(f"Error fetching prices: {ticker} - {response.status_code} - {response.text}")
-    if response.status_code == 404:
-        return []
+    # If not in cache, fetch from API; concurrent callers for the same key
+    # share a single in-flight request
+    def _fetch():
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
 
-    # Parse response with Pydantic model
-    price_response = PriceResponse(**response.json())
-    prices = price_response.prices
+        url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+        response = _session.get(url, headers=headers)
+        if response.status_code != 200:
+            print(f"Error fetching prices: {ticker} - {response.status_code} - {response.text}")
+        if response.status_code == 404:
+            return []
 
-    if not prices:
-        return []
+        # Parse response with Pydantic model
+        price_response = PriceResponse(**response.json())
+        prices = price_response.prices
 
-    # Cache the results using the comprehensive cache key
-    _cache.insert(cache_key, prices)
+        if not prices:
+            return []
 
-    return prices
+        # Cache the results using the comprehensive cache key
+        _cache.insert(cache_key, prices)
+        _register_price_range(ticker, start_date, end_date, cache_key)
+        save_cache_if_dirty()
+
+        return prices
+
+    return _fetch_coalesced(cache_key, _fetch)
 
 
 @retry(wait=wait_random_exponential(multiplier=1, max=60))
@@ -69,31 +194,36 @@ def get_financial_metrics(
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_metrics_{period}_{end_date}_{limit}"
     
-    # Check cache first - simple exact match
-    if cache_key in _cache:
-        return [FinancialMetrics(**metric) for metric in _cache[f"{cache_key}"]]
-
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        print(f"Error fetching metrics: {ticker} - {response.status_code} - {response.text}")
-
-    # Parse response with Pydantic model
-    metrics_response = FinancialMetricsResponse(**response.json())
-    financial_metrics = metrics_response.financial_metrics
+    # Single probe that also updates the entry's eviction standing (vs. separate `in` + `[]` lookups)
+    if (cached := _cache.get(cache_key)) is not None:
+        return cached
+
+    # If not in cache, fetch from API; concurrent callers for the same key
+    # share a single in-flight request
+    def _fetch():
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
+
+        url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit={limit}&period={period}"
+        response = _session.get(url, headers=headers)
+        if response.status_code != 200:
+            print(f"Error fetching metrics: {ticker} - {response.status_code} - {response.text}")
+
+        # Parse response with Pydantic model
+        metrics_response = FinancialMetricsResponse(**response.json())
+        financial_metrics = metrics_response.financial_metrics
     
-    if not financial_metrics:
-        return []
+        if not financial_metrics:
+            return []
+
+        # Cache the results using the comprehensive cache key
+        _cache.insert(cache_key, financial_metrics)
+        save_cache_if_dirty()
 
-    # Cache the results using the comprehensive cache key
-    _cache.insert(cache_key, financial_metrics)
+        return financial_metrics
 
-    return financial_metrics
+    return _fetch_coalesced(cache_key, _fetch)
 
 
 @retry(wait=wait_random_exponential(multiplier=1, max=60))
@@ -107,68 +237,40 @@ def search_line_items(
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_line-items_{period}_{end_date}"
     
-    # Check cache first - simple exact match
-    if cache_key in _cache:
-        return [LineItems(**item) for item in _cache[f"{cache_key}"]]
-
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    url = "https://api.financialdatasets.ai/financials/search/line-items"
-    
-    line_items = [
-        'book_value_per_share',
-        'capital_expenditure',
-        'cash_and_equivalents',
-        'current_assets',
-        'current_liabilities',
-        'debt_to_equity',
-        'depreciation_and_amortization',
-        'dividends_and_other_cash_distributions',
-        'earnings_per_share',
-        'ebit',
-        'ebitda',
-        'free_cash_flow',
-        'goodwill_and_intangible_assets',
-        'gross_margin',
-        'gross_profit',
-        'interest_expense',
-        'issuance_or_purchase_of_equity_shares',
-        'net_income',
-        'operating_expense',
-        'operating_income',
-        'operating_margin',
-        'outstanding_shares',
-        'research_and_development',
-        'return_on_invested_capital',
-        'revenue',
-        'shareholders_equity',
-        'total_assets',
-        'total_debt',
-        'total_liabilities',
-        'working_capital',
-    ]
+    # Single probe that also updates the entry's eviction standing (vs. separate `in` + `[]` lookups)
+    if (cached := _cache.get(cache_key)) is not None:
+        return cached
+
+    # If not in cache, fetch from API; concurrent callers for the same key
+    # share a single in-flight request
+    def _fetch():
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
+
+        url = "https://api.financialdatasets.ai/financials/search/line-items"
     
-    body = {
-        "tickers": [ticker],
-        "line_items": line_items,
-        "end_date": end_date,
-        "period": period,
-        "limit": limit,
-    }
+        body = {
+            "tickers": [ticker],
+            "line_items": _LINE_ITEMS,
+            "end_date": end_date,
+            "period": period,
+            "limit": limit,
+        }
     
-    response = requests.post(url, headers=headers, json=body)
-    if response.status_code != 200:
-        print(f"Error fetching line items: {ticker} - {response.status_code} - {response.text}")
-    items_response = LineItemsResponse(**response.json())
-    search_results = items_response.search_results
+        response = _session.post(url, headers=headers, json=body)
+        if response.status_code != 200:
+            print(f"Error fetching line items: {ticker} - {response.status_code} - {response.text}")
+        items_response = LineItemsResponse(**response.json())
+        search_results = items_response.search_results
 
-    # Cache the results as dicts using the comprehensive cache key
-    _cache.insert(cache_key, search_results)
+        # Cache the results as dicts using the comprehensive cache key
+        _cache.insert(cache_key, search_results)
+        save_cache_if_dirty()
 
-    return search_results
+        return search_results
+
+    return _fetch_coalesced(cache_key, _fetch)
 
 
 @retry(wait=wait_random_exponential(multiplier=1, max=60))
@@ -182,57 +284,65 @@ def get_insider_trades(
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_insider-trades_{start_date or 'none'}_{end_date}_{limit}"
     
-    # Check cache first - simple exact match
-    if cache_key in _cache:
-        return [InsiderTrade(**trade) for trade in  _cache[f"{cache_key}"]]
-
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    all_trades = []
-    current_end_date = end_date
-
-    while True:
-        url = f"https://api.financialdatasets.ai/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
-        if start_date:
-            url += f"&filing_date_gte={start_date}"
-        url += f"&limit={limit}"
-
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            print(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
-
-        data = response.json()
-        response_model = InsiderTradeResponse(**data)
-        insider_trades = response_model.insider_trades
-
-        if not insider_trades:
-            break
-
-        all_trades.extend(insider_trades)
-
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(insider_trades) < limit:
-            break
-
-        # Update end_date to the oldest filing date from current batch for next iteration
-        current_end_date = min(trade.filing_date for trade in insider_trades).split("T")[0]
-
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
+    # Single probe that also updates the entry's eviction standing (vs. separate `in` + `[]` lookups)
+    if (cached := _cache.get(cache_key)) is not None:
+        return cached
+
+    # If not in cache, fetch from API; concurrent callers for the same key
+    # share a single in-flight request
+    def _fetch():
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
+
+        all_trades = []
+        current_end_date = end_date
+
+        while True:
+            url = f"https://api.financialdatasets.ai/insider-trades/?ticker={ticker}&filing_date_lte={current_end_date}"
+            if start_date:
+                url += f"&filing_date_gte={start_date}"
+            url += f"&limit={limit}"
+
+            response = _session.get(url, headers=headers)
+            if response.status_code != 200:
+                print(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+
+            data = response.json()
+            response_model = InsiderTradeResponse(**data)
+            insider_trades = response_model.insider_trades
+
+            if not insider_trades:
+                break
+
+            all_trades.extend(insider_trades)
+
+            # Only continue pagination if we have a start_date and got a full page
+            if not start_date or len(insider_trades) < limit:
+                break
+
+            # The API returns pages newest-first, so the oldest filing date for the
+            # next iteration is simply the last row — no need to min() over the batch
+            raw_trades = data["insider_trades"]
+            assert raw_trades[-1]["filing_date"] <= raw_trades[0]["filing_date"], "expected filing_date-descending page"
+            current_end_date = raw_trades[-1]["filing_date"].split("T")[0]
+
+            # If we've reached or passed the start_date, we can stop
+            if current_end_date <= start_date:
+                break
     
-    if not all_trades:
-        return []
+        if not all_trades:
+            return []
+
+        # Cache the results using the comprehensive cache key
+        _cache.insert(cache_key, all_trades)
+        save_cache_if_dirty()
 
-    # Cache the results using the comprehensive cache key
-    _cache.insert(cache_key, all_trades)
+        return all_trades
 
-    return all_trades
+    return _fetch_coalesced(cache_key, _fetch)
 
-#@retry(wait=wait_random_exponential(multiplier=1, max=60))
+@retry(wait=wait_random_exponential(multiplier=1, max=60), stop=stop_after_attempt(6), retry=retry_if_exception_type(requests.RequestException))
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -243,101 +353,88 @@ def get_company_news(
     # Create a cache key that includes all parameters to ensure exact matches
     cache_key = f"{ticker}_company-news_{start_date or 'none'}_{end_date}_{limit}"
     
-    # Check cache first - simple exact match
-    if cache_key in _cache:
-        return [CompanyNews(**news) for news in _cache[f"{cache_key}"]]
+    # Single probe that also updates the entry's eviction standing (vs. separate `in` + `[]` lookups)
+    if (cached := _cache.get(cache_key)) is not None:
+        return cached
 
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
+    # If not in cache, fetch from API; concurrent callers for the same key
+    # share a single in-flight request
+    def _fetch():
+        headers = {}
+        if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
+            headers["X-API-KEY"] = api_key
 
-    all_news = []
-    current_end_date = end_date
+        all_news = []
+        current_end_date = end_date
 
-    while True:
-        url = f"https://api.financialdatasets.ai/news/?ticker={ticker}&end_date={current_end_date}"
-        if start_date:
-            url += f"&start_date={start_date}"
-        url += f"&limit={limit}"
+        while True:
+            url = f"https://api.financialdatasets.ai/news/?ticker={ticker}&end_date={current_end_date}"
+            if start_date:
+                url += f"&start_date={start_date}"
+            url += f"&limit={limit}"
 
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            print(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
+            response = _session.get(url, headers=headers)
+            if response.status_code != 200:
+                print(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-        data = response.json()
-        response_model = CompanyNewsResponse(**data)
-        company_news = response_model.news
+            data = response.json()
+            response_model = CompanyNewsResponse(**data)
+            company_news = response_model.news
 
-        if not company_news:
-            break
+            if not company_news:
+                break
 
-        all_news.extend(company_news)
+            all_news.extend(company_news)
 
-        # Only continue pagination if we have a start_date and got a full page
-        if not start_date or len(company_news) < limit:
-            break
+            # Only continue pagination if we have a start_date and got a full page
+            if not start_date or len(company_news) < limit:
+                break
 
-        # Update end_date to the oldest date from current batch for next iteration
-        current_end_date = min(news.date for news in company_news).split("T")[0]
+            # The API returns pages newest-first, so the oldest date for the next
+            # iteration is simply the last row — no need to min() over the batch
+            raw_news = data["news"]
+            assert raw_news[-1]["date"] <= raw_news[0]["date"], "expected date-descending page"
+            current_end_date = raw_news[-1]["date"].split("T")[0]
 
-        # If we've reached or passed the start_date, we can stop
-        if current_end_date <= start_date:
-            break
+            # If we've reached or passed the start_date, we can stop
+            if current_end_date <= start_date:
+                break
 
-    if not all_news:
-        return []
+        if not all_news:
+            return []
 
-    # Cache the results using the comprehensive cache key
-    _cache.insert(cache_key, all_news)
+        # Cache the results using the comprehensive cache key
+        _cache.insert(cache_key, all_news)
+        save_cache_if_dirty()
 
-    return all_news
+        return all_news
+
+    return _fetch_coalesced(cache_key, _fetch)
 
 
-@retry(wait=wait_random_exponential(multiplier=1, max=60))
 def get_market_cap(
     ticker: str,
     end_date: str,
 ) -> float | None:
-    """Fetch market cap; rework to stop multiple API calls"""
-    cache_key = f"{ticker}_metrics_ttm_{end_date}_10"
-
-    if cache_key in _cache:
-        return _cache[f"{cache_key}"][0].market_cap
-
-    # If not in cache, fetch from API
-    headers = {}
-    if api_key := os.environ.get("FINANCIAL_DATASETS_API_KEY"):
-        headers["X-API-KEY"] = api_key
-
-    url = f"https://api.financialdatasets.ai/financial-metrics/?ticker={ticker}&report_period_lte={end_date}&limit=1&period=ttm"
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        print(f"Error fetching market cap: {ticker} - {response.status_code} - {response.text}")
-
-    # Parse response with Pydantic model
-    metrics_response = FinancialMetricsResponse(**response.json())
-    financial_metrics = metrics_response.financial_metrics
-    market_cap = financial_metrics[0].market_cap
-    
-    if not market_cap:
-        return []
-
-    # Cache the results using the comprehensive cache key
-    _cache.insert(cache_key, financial_metrics)
+    """Fetch market cap from the financial metrics."""
+    financial_metrics = get_financial_metrics(ticker, end_date)
+    if not financial_metrics:
+        return None
 
-    return market_cap
+    return financial_metrics[0].market_cap
 
 
 def prices_to_df(prices: list[Price]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
+    df = pd.DataFrame.from_records(
+        [(p.time, p.open, p.close, p.high, p.low, p.volume) for p in prices],
+        columns=["time", "open", "close", "high", "low", "volume"],
+    )
+    df = df.astype({"open": "float32", "close": "float32", "high": "float32", "low": "float32", "volume": "int64"}, copy=False)
+    # Prices arrive date-sorted from the API (and cache slices preserve that),
+    # so no re-sort is needed after indexing by time
+    df.index = pd.to_datetime(df.pop("time"), cache=True)
+    df.index.name = "Date"
     return df
 
 